@@ -3,6 +3,7 @@
 import { useEffect, useMemo, useRef, useState } from 'react'
 import { Room, RoomEvent, RemoteTrackPublication, Track, RemoteParticipant } from 'livekit-client'
 import { useAttendeeStore } from '@/lib/stores/attendeeStore'
+import { getLegacyCaptionText, unpackLiveKitMessages } from '@/types/livekit-messages'
 
 interface AttendeeLiveProps {
   roomName: string
@@ -71,6 +72,30 @@ export function AttendeeLive(props: AttendeeLiveProps) {
     // Register the text stream handler for agent transcriptions
     r.registerTextStreamHandler('lk.transcription', handleTranscriptions)
 
+    // The legacy worker publishes captions on the data channel; several messages
+    // sent together arrive as one batch envelope, so always unpack before matching
+    const decoder = new TextDecoder()
+    const handleData = (payload: Uint8Array) => {
+      if (!enableCaptions || !selectedLangCode) return
+
+      let parsed: unknown
+      try {
+        parsed = JSON.parse(decoder.decode(payload))
+      } catch {
+        return
+      }
+
+      const lines: string[] = []
+      for (const msg of unpackLiveKitMessages(parsed)) {
+        const text = getLegacyCaptionText(msg, selectedLangCode)
+        if (text) lines.push(text)
+      }
+      if (lines.length > 0) {
+        setCaptions(prev => [...prev, ...lines].slice(-50)) // Keep last 50 captions
+      }
+    }
+    r.on(RoomEvent.DataReceived, handleData)
+
     return () => {
       try { 
         // Unregister text stream handler
@@ -35,6 +35,12 @@ export interface TranslationAudioMessage {
   ts: number
 }
 
+// Several legacy worker messages packed into one data-channel send
+export interface BatchMessage {
+  type: 'batch'
+  messages: unknown[]
+}
+
 // New LiveKit Agents messages
 export interface AgentTranslationTextMessage {
   type: 'translation_text'
@@ -73,6 +79,7 @@ export type LiveKitMessage =
   | OriginalLanguageTextMessage 
   | TranslationTextMessage 
   | TranslationAudioMessage
+  | BatchMessage
   | AgentTranslationTextMessage
   | AgentTranscriptionMessage
   | AgentConfigUpdateMessage
@@ -117,6 +124,27 @@ export function isTranslationAudioMessage(msg: unknown): msg is TranslationAudio
     'ts' in msg && typeof msg.ts === 'number'
 }
 
+export function isBatchMessage(msg: unknown): msg is BatchMessage {
+  return typeof msg === 'object' && msg !== null &&
+    'type' in msg && msg.type === 'batch' &&
+    'messages' in msg && Array.isArray(msg.messages)
+}
+
+// Flatten a received message into the individual messages it carries
+export function unpackLiveKitMessages(msg: unknown): unknown[] {
+  return isBatchMessage(msg) ? msg.messages : [msg]
+}
+
+// Caption text a legacy worker message carries for a language (its translation, or
+// the caption itself when the language is the source), or null
+export function getLegacyCaptionText(msg: unknown, lang: string): string | null {
+  if (typeof msg !== 'object' || msg === null ||
+    !('type' in msg) || !('text' in msg) || typeof msg.text !== 'string') return null
+  if (msg.type === `translation-text-${lang}`) return msg.text
+  if (isCaptionMessage(msg) && msg.lang === lang) return msg.text
+  return null
+}
+
 // New type guards for agent messages
 export function isAgentTranslationTextMessage(msg: unknown): msg is AgentTranslationTextMessage {
   return typeof msg === 'object' && msg !== null &&
@@ -153,6 +181,7 @@ export function isLiveKitMessage(msg: unknown): msg is LiveKitMessage {
     isOriginalLanguageTextMessage(msg) || 
     isTranslationTextMessage(msg) || 
     isTranslationAudioMessage(msg) ||
+    isBatchMessage(msg) ||
     isAgentTranslationTextMessage(msg) ||
     isAgentTranscriptionMessage(msg) ||
     isAgentConfigUpdateMessage(msg) ||
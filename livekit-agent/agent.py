@@ -2,41 +2,172 @@
 LiveKit Translation Agent for Event Translator
 Simple one-language-per-agent approach using Google STT + LLM Translation + Google TTS
 """
+import asyncio
+import atexit
+import functools
 import os
 import json
 import logging
-from typing import Dict, Any, List
+import logging.handlers
+import queue
+import time
+import types
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 import aiohttp
+import orjson
 
 from livekit import agents, rtc
 from livekit.agents import AgentSession, Agent, RoomInputOptions, RoomOutputOptions
 from livekit.plugins import google, openai
 
-# Load environment variables
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Google credentials file shipped next to this script (resolved once per process)
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_CREDS_PATH = os.path.join(_SCRIPT_DIR, "Google cloud credentials json")
+_CREDS_EXISTS = os.path.exists(_CREDS_PATH)
+
+# Language code -> display name used in the translation instructions
+_LANG_MAP: Mapping[str, str] = types.MappingProxyType({
+    'es-ES': 'Spanish', 'es': 'Spanish',
+    'fr-FR': 'French', 'fr': 'French',
+    'de-DE': 'German', 'de': 'German',
+    'it-IT': 'Italian', 'it': 'Italian',
+    'pt-PT': 'Portuguese', 'pt': 'Portuguese',
+    'pt-BR': 'Brazilian Portuguese',
+    'zh-CN': 'Chinese', 'zh': 'Chinese',
+    'ja-JP': 'Japanese', 'ja': 'Japanese',
+    'ko-KR': 'Korean', 'ko': 'Korean',
+    'ru-RU': 'Russian', 'ru': 'Russian',
+    'ar-SA': 'Arabic', 'ar': 'Arabic',
+    'hi-IN': 'Hindi', 'hi': 'Hindi',
+    'nl-NL': 'Dutch', 'nl': 'Dutch',
+    'sv-SE': 'Swedish', 'sv': 'Swedish',
+    'pl-PL': 'Polish', 'pl': 'Polish'
+})
+
+# Translation instructions; only the language names vary per agent
+_TRANSLATOR_PROMPT = """You are a professional real-time translator for live events.
+
+Your task: Translate everything you hear from {source} to {target}.
+
+Guidelines:
+1. Provide accurate, natural translations in {target}
+2. Maintain the speaker's tone, emotion, and intent
+3. Be concise but complete - don't add or remove meaning
+4. Adapt cultural references appropriately for the target audience
+5. Use appropriate formality based on the speaker's tone
+
+CRITICAL INSTRUCTIONS:
+- Output ONLY the translation in {target}
+- Do NOT announce "translation" or any preamble
+- Do NOT repeat the {source} text
+- Translate EVERYTHING you hear
+
+Speak naturally and fluently in {target} as if you were the original speaker."""
+
+# Fully rendered instructions for every known target language
+_INSTRUCTIONS_BY_LANG: Mapping[str, str] = types.MappingProxyType({
+    code: _TRANSLATOR_PROMPT.format(source="English", target=name)
+    for code, name in _LANG_MAP.items()
+})
+
+
+def language_display_name(code: str) -> str:
+    """Display name for a language code, falling back to its base language (es-MX -> Spanish)"""
+    return _LANG_MAP.get(code) or _LANG_MAP.get(code.split('-', 1)[0], code)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_instructions(target_language: str, source_language: str = "English") -> str:
+    """Render translator instructions for a language pair (memoized)"""
+    language_name = language_display_name(target_language)
+    return _TRANSLATOR_PROMPT.format(source=source_language, target=language_name)
+
+
+# Environment variables that must be set before the worker starts
+# (Google credentials are loaded automatically from the local file)
+_REQUIRED_VARS = (
+    "TARGET_LANGUAGE",  # Required for this agent
+    "OPENAI_API_KEY",  # For LLM translation
+    "LIVEKIT_API_KEY",
+    "LIVEKIT_API_SECRET",
+)
+
+# Shared HTTP session for app API calls (created lazily inside the job's event loop)
+_http_session: Optional[aiohttp.ClientSession] = None
+
+# Event configuration cache: room_name -> (fetched_at, config or None for "not found")
+_event_cfg_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+EVENT_CONFIG_TTL = 30.0
+EVENT_CONFIG_NEGATIVE_TTL = 5.0
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide HTTP session, creating it on first use"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75),
+            timeout=aiohttp.ClientTimeout(total=5),
+        )
+    return _http_session
+
+
+async def close_http_session():
+    """Close the shared HTTP session (registered as a job shutdown callback)"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
+async def fetch_event_config(app_url: str, room_name: str, ttl: float = EVENT_CONFIG_TTL) -> Optional[Dict[str, Any]]:
+    """Fetch event configuration for a room, reusing a recent result if available"""
+    cached = _event_cfg_cache.get(room_name)
+    if cached is not None:
+        fetched_at, config = cached
+        max_age = ttl if config is not None else EVENT_CONFIG_NEGATIVE_TTL
+        if time.monotonic() - fetched_at < max_age:
+            return config
+
+    http_session = get_http_session()
+    url = f"{app_url}/api/events/by-room/{room_name}"
+    async with http_session.get(url) as response:
+        if response.status == 200:
+            config = await response.json(loads=orjson.loads)
+            _event_cfg_cache[room_name] = (time.monotonic(), config)
+            return config
+        if response.status == 404:
+            # Remember missing rooms briefly so reconnect storms don't hammer the app
+            _event_cfg_cache[room_name] = (time.monotonic(), None)
+        logger.warning("⚠️ Could not fetch event config: HTTP %s", response.status)
+        return None
+
+
+async def load_event_config(app_url: str, room_name: str) -> Optional[Dict[str, Any]]:
+    """Fetch and log the event configuration; failures are logged, never raised"""
+    try:
+        event_config = await fetch_event_config(app_url, room_name)
+        if event_config and logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Event configuration loaded: %s", event_config.get('eventName', 'Unknown'))
+        return event_config
+    except Exception as e:
+        logger.warning("⚠️ Could not fetch event configuration: %s", e)
+        # Continue anyway - event config is optional for agent operation
+        return None
+
 
 def setup_google_credentials():
     """Setup Google credentials from local file"""
-    # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Path to the credentials file in the same directory
-    credentials_file = os.path.join(script_dir, "Google cloud credentials json")
-    
-    # Check if file exists
-    if os.path.exists(credentials_file):
+    if _CREDS_EXISTS:
         # Set the environment variable to point to our credentials file
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_file
-        logger.info(f"🔐 Using Google Cloud credentials from: {credentials_file}")
-        return credentials_file
+        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = _CREDS_PATH
+        logger.info("🔐 Using Google Cloud credentials from: %s", _CREDS_PATH)
+        return _CREDS_PATH
     else:
-        logger.error(f"❌ Google credentials file not found: {credentials_file}")
+        logger.error("❌ Google credentials file not found: %s", _CREDS_PATH)
         logger.error("   Make sure 'Google cloud credentials json' file exists in livekit-agent folder")
         return None
 
@@ -45,50 +176,47 @@ class SimpleTranslationAgent(Agent):
     """Simple agent that translates en-US → target_language using LLM"""
     
     def __init__(self, target_language: str):
-        # Create clear translation instructions for the LLM
-        language_map = {
-            'es-ES': 'Spanish', 'es': 'Spanish',
-            'fr-FR': 'French', 'fr': 'French',
-            'de-DE': 'German', 'de': 'German',
-            'it-IT': 'Italian', 'it': 'Italian',
-            'pt-PT': 'Portuguese', 'pt': 'Portuguese',
-            'pt-BR': 'Brazilian Portuguese',
-            'zh-CN': 'Chinese', 'zh': 'Chinese',
-            'ja-JP': 'Japanese', 'ja': 'Japanese',
-            'ko-KR': 'Korean', 'ko': 'Korean',
-            'ru-RU': 'Russian', 'ru': 'Russian',
-            'ar-SA': 'Arabic', 'ar': 'Arabic',
-            'hi-IN': 'Hindi', 'hi': 'Hindi',
-            'nl-NL': 'Dutch', 'nl': 'Dutch',
-            'sv-SE': 'Swedish', 'sv': 'Swedish',
-            'pl-PL': 'Polish', 'pl': 'Polish'
-        }
+        language_name = language_display_name(target_language)
         
-        language_name = language_map.get(target_language, target_language)
+        instructions = _INSTRUCTIONS_BY_LANG.get(target_language) or _build_instructions(target_language)
+
+        super().__init__(instructions=instructions)
+        self.target_language = target_language
         
-        instructions = f"""You are a professional real-time translator for live events.
+        logger.info("🎯 Initialized LLM translator: English → %s (%s)", language_name, target_language)
 
-Your task: Translate everything you hear from English to {language_name}.
 
-Guidelines:
-1. Provide accurate, natural translations in {language_name}
-2. Maintain the speaker's tone, emotion, and intent
-3. Be concise but complete - don't add or remove meaning
-4. Adapt cultural references appropriately for the target audience
-5. Use appropriate formality based on the speaker's tone
+def create_pipeline_plugins(target_language: str, target_voice: Optional[str]) -> Dict[str, Any]:
+    """Build the STT/LLM/TTS plugins for one translation session"""
+    return {
+        "key": (target_language, target_voice),
+        "stt": google.STT(
+            model="chirp",  # Google's latest STT model
+            languages=["en-US"],  # Source language is always English
+            spoken_punctuation=False
+        ),
+        "llm": openai.LLM(
+            model="gpt-4o-mini"  # LLM handles translation via instructions
+        ),
+        "tts": google.TTS(
+            language=target_language,
+            voice_name=target_voice
+        ),
+    }
 
-CRITICAL INSTRUCTIONS:
-- Output ONLY the translation in {language_name}
-- Do NOT announce "translation" or any preamble
-- Do NOT repeat the English text
-- Translate EVERYTHING you hear
 
-Speak naturally and fluently in {language_name} as if you were the original speaker."""
-
-        super().__init__(instructions=instructions)
-        self.target_language = target_language
-        
-        logger.info(f"🎯 Initialized LLM translator: English → {language_name} ({target_language})")
+def prewarm(proc: agents.JobProcess):
+    """Construct plugins while the process is idle so the first room join skips
+    the gRPC/OpenAI imports and credential loading"""
+    target_language = os.getenv("TARGET_LANGUAGE")
+    if not target_language:
+        return
+    
+    try:
+        proc.userdata["plugins"] = create_pipeline_plugins(target_language, os.getenv("TARGET_VOICE"))
+    except Exception as e:
+        # Not fatal - entrypoint builds the plugins itself
+        logger.warning("⚠️ Could not prewarm translation plugins: %s", e)
 
 
 async def entrypoint(ctx: agents.JobContext):
@@ -104,46 +232,36 @@ async def entrypoint(ctx: agents.JobContext):
         logger.error("   Example: TARGET_LANGUAGE=es-ES")
         return
     
-    logger.info(f"🎪 Translation agent joining event room: {room_name}")
-    logger.info(f"🎯 Target language: {target_language}")
-    logger.info(f"🔊 Target voice: {target_voice or 'default'}")
+    logger.info("🎪 Translation agent joining event room: %s", room_name)
+    logger.info("🎯 Target language: %s", target_language)
+    logger.info("🔊 Target voice: %s", target_voice or 'default')
     
-    # Optional: Fetch event configuration for validation (you can remove this if not needed)
+    # Optional: Fetch event configuration for validation (you can remove this if not needed).
+    # Runs in the background so the HTTP round-trip overlaps agent/session construction.
     app_url = os.getenv("APP_URL")
+    config_task: Optional[asyncio.Task] = None
     if app_url:
-        try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{app_url}/api/events/by-room/{room_name}"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        event_config = await response.json()
-                        logger.info(f"✅ Event configuration loaded: {event_config.get('eventName', 'Unknown')}")
-                    else:
-                        logger.warning(f"⚠️ Could not fetch event config: HTTP {response.status}")
-        except Exception as e:
-            logger.warning(f"⚠️ Could not fetch event configuration: {e}")
-            # Continue anyway - event config is optional for agent operation
+        ctx.add_shutdown_callback(close_http_session)
+        config_task = asyncio.create_task(load_event_config(app_url, room_name))
     
     try:
         # Create simple translation agent with LLM instructions
         translator = SimpleTranslationAgent(target_language=target_language)
         
-        # Create AgentSession with Google STT + OpenAI LLM Translation + Google TTS
+        # Create AgentSession with Google STT + OpenAI LLM Translation + Google TTS,
+        # reusing the plugins built by prewarm() when they match this job
+        plugins = ctx.proc.userdata.pop("plugins", None)
+        if not plugins or plugins["key"] != (target_language, target_voice):
+            plugins = create_pipeline_plugins(target_language, target_voice)
         session = AgentSession(
-            stt=google.STT(
-                model="chirp",  # Google's latest STT model
-                languages=["en-US"],  # Source language is always English
-                spoken_punctuation=False
-            ),
-            llm=openai.LLM(
-                model="gpt-4o-mini"  # LLM handles translation via instructions
-            ),
-            tts=google.TTS(
-                language=target_language,
-                voice_name=target_voice
-            )
+            stt=plugins["stt"],
+            llm=plugins["llm"],
+            tts=plugins["tts"]
         )
         
+        if config_task:
+            await config_task
+        
         # Start standard session - uses agent's standard audio track
         logger.info("🔄 Starting LLM translation pipeline...")
         await session.start(
@@ -156,52 +274,75 @@ async def entrypoint(ctx: agents.JobContext):
             )
         )
         
-        logger.info(f"✅ LLM Translation agent active: English → {target_language}")
+        logger.info("✅ LLM Translation agent active: English → %s", target_language)
         logger.info("📻 Listening for English speech...")
         logger.info("🎙️ Publishing translations via standard agent audio track")
         logger.info("🤖 Using LLM for translation (no custom track names needed)")
         
     except Exception as e:
-        logger.error(f"❌ Failed to start translation agent: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        if config_task and not config_task.done():
+            config_task.cancel()
+        logger.exception("❌ Failed to start translation agent: %s", e)
         raise
 
 
+def configure_logging():
+    """Configure root logging once per process, formatting records off the event loop"""
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        "%(asctime)s %(levelname)s %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        style="%",
+    ))
+    
+    # Records are enqueued by the caller and formatted/written by a background thread
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+
+def load_env_file():
+    """Load .env unless the environment was already injected (e.g. by the orchestrator)"""
+    if os.getenv("SKIP_DOTENV") != "1" and not os.getenv("LIVEKIT_API_KEY"):
+        load_dotenv(override=False)
+
+
 def main():
     """Main function to run the agent"""
+    # Load environment variables (job processes inherit them from the worker)
+    load_env_file()
+    configure_logging()
+    
     logger.info("🚀 Starting Simple LLM Translation Agent")
     
     # Setup Google credentials from local file
     credentials_path = setup_google_credentials()
     
-    # Verify required environment variables
-    required_vars = [
-        "TARGET_LANGUAGE",  # Required for this agent
-        "OPENAI_API_KEY",  # For LLM translation
-        "LIVEKIT_API_KEY", 
-        "LIVEKIT_API_SECRET"
-    ]
-    # Note: Google credentials loaded automatically from local file
+    env = os.environ
     
     # Handle LIVEKIT_URL with fallback
-    livekit_url = os.getenv("LIVEKIT_URL") or os.getenv("LIVEKIT_SERVER_URL")
+    livekit_url = env.get("LIVEKIT_URL") or env.get("LIVEKIT_SERVER_URL")
     if livekit_url:
-        os.environ["LIVEKIT_URL"] = livekit_url
-        logger.info(f"📍 LiveKit URL: {livekit_url}")
+        env["LIVEKIT_URL"] = livekit_url
+        logger.info("📍 LiveKit URL: %s", livekit_url)
     else:
         logger.error("❌ Missing LIVEKIT_URL environment variable")
         logger.error("   Set LIVEKIT_URL to your LiveKit Cloud URL (e.g., wss://your-project.livekit.cloud)")
         return
     
     # Check required variables
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    missing_vars = [var for var in _REQUIRED_VARS if not env.get(var)]
     
     if missing_vars:
-        logger.error(f"❌ Missing required environment variables: {missing_vars}")
+        logger.error("❌ Missing required environment variables: %s", missing_vars)
         logger.error("   TARGET_LANGUAGE: Target language code (e.g., es-ES, fr-FR)")
         logger.error("   OPENAI_API_KEY: OpenAI API key for LLM translation")
         return
@@ -212,8 +353,8 @@ def main():
         logger.error("   Place 'Google cloud credentials json' file in the livekit-agent folder")
         return
     
-    target_language = os.getenv("TARGET_LANGUAGE")
-    logger.info(f"🎯 Agent configured for: en-US → {target_language}")
+    target_language = env["TARGET_LANGUAGE"]
+    logger.info("🎯 Agent configured for: en-US → %s", target_language)
     
     # Log authentication method (already logged in setup_google_credentials)
     # Google credentials are now set up and ready to use
@@ -225,6 +366,7 @@ def main():
     # Create and run worker with explicit agent name
     worker_options = agents.WorkerOptions(
         entrypoint_fnc=entrypoint,
+        prewarm_fnc=prewarm,
         agent_name=f"translator-{target_language}"  # Explicit agent naming for dispatch
     )
     
@@ -2,6 +2,6 @@
 Audio processing and conversion utilities.
 """
 from .processor import AudioProcessor
-from .converter import AudioConverter
+from .converter import AudioConverter, AudioFrameStream
 
-__all__ = ["AudioProcessor", "AudioConverter"]
+__all__ = ["AudioProcessor", "AudioConverter", "AudioFrameStream"]
@@ -2,8 +2,7 @@
 Audio format conversion utilities.
 """
 import logging
-import numpy as np
-from typing import AsyncIterator, List
+from typing import Optional, Union
 from livekit import rtc
 
 from ..models import AudioConfig
@@ -16,50 +15,69 @@ class AudioConverter:
     
     def __init__(self, config: AudioConfig = AudioConfig()):
         self.config = config
+        # 16-bit PCM frame size, and the silence used to pad the tail frame
+        self._frame_bytes = config.frame_samples * 2
+        self._silence = bytes(self._frame_bytes)
+    
+    def create_frame_stream(self, audio_source: rtc.AudioSource) -> "AudioFrameStream":
+        """Create a stream that publishes TTS audio to the source as chunks arrive"""
+        return AudioFrameStream(self, audio_source)
+    
+    def create_audio_frame(self) -> rtc.AudioFrame:
+        """Create a silent frame of the configured size, for reuse across captures"""
+        return rtc.AudioFrame(
+            data=self._silence,
+            sample_rate=self.config.sample_rate,
+            num_channels=self.config.num_channels,
+            samples_per_channel=self.config.frame_samples
+        )
     
     async def bytes_to_audio_frames(
         self, 
-        audio_data: bytes,
-        audio_source: rtc.AudioSource
+        audio_data: Union[bytes, memoryview],
+        audio_source: rtc.AudioSource,
+        frame: Optional[rtc.AudioFrame] = None
     ) -> None:
         """Convert TTS audio bytes to audio frames and publish to source"""
         try:
-            # Convert bytes to numpy array (assuming 16-bit PCM)
-            int16_data = np.frombuffer(audio_data, dtype=np.int16)
-            float32_data = int16_data.astype(np.float32) / 32767.0
-            
-            # Create and publish audio frames
-            await self._publish_audio_frames(float32_data, audio_source)
+            # LiveKit frames carry 16-bit PCM bytes directly, so no sample conversion is needed
+            await self._publish_audio_frames(audio_data, audio_source, frame)
             
         except Exception as e:
             logger.error(f"Error converting audio bytes to frames: {e}")
     
     async def _publish_audio_frames(
         self, 
-        audio_data: np.ndarray,
-        audio_source: rtc.AudioSource
+        audio_data: Union[bytes, memoryview],
+        audio_source: rtc.AudioSource,
+        frame: Optional[rtc.AudioFrame] = None
     ) -> None:
-        """Publish audio frames to the audio source"""
+        """Publish audio frames to the audio source, reusing one frame buffer"""
         try:
-            # Create frames with configured sample count
-            for i in range(0, len(audio_data), self.config.frame_samples):
-                frame_data = audio_data[i:i + self.config.frame_samples]
-                
-                # Pad frame if necessary
-                if len(frame_data) < self.config.frame_samples:
-                    padded = np.zeros(self.config.frame_samples, dtype=np.float32)
-                    padded[:len(frame_data)] = frame_data
-                    frame_data = padded
-                
-                # Create and capture audio frame
-                frame = rtc.AudioFrame(
-                    data=frame_data.tobytes(),
-                    sample_rate=self.config.sample_rate,
-                    num_channels=self.config.num_channels,
-                    samples_per_channel=len(frame_data)
-                )
+            # capture_frame copies the samples before returning, so a single frame
+            # is refilled in place for every 10 ms of audio instead of reallocated
+            if frame is None:
+                frame = self.create_audio_frame()
+            frame_buffer = frame.data.cast('B')
+            
+            # Bind loop invariants as locals - this loop runs 100 times per second per language
+            frame_bytes = self._frame_bytes
+            silence = self._silence
+            capture_frame = audio_source.capture_frame
+            audio_view = memoryview(audio_data)
+            data_len = len(audio_data)
+            
+            for offset in range(0, data_len, frame_bytes):
+                end = offset + frame_bytes
+                if end <= data_len:
+                    frame_buffer[:] = audio_view[offset:end]
+                else:
+                    # Pad the tail frame with silence
+                    tail = data_len - offset
+                    frame_buffer[:tail] = audio_view[offset:]
+                    frame_buffer[tail:] = silence[tail:]
                 
-                await audio_source.capture_frame(frame)
+                await capture_frame(frame)
                 
         except Exception as e:
             logger.error(f"Error publishing audio frames: {e}")
@@ -85,3 +103,40 @@ class AudioConverter:
         num_samples = len(audio_data) // 2  # 2 bytes per sample
         duration = num_samples / self.config.sample_rate
         return duration
+
+
+class AudioFrameStream:
+    """Publishes streamed 16-bit PCM chunks as fixed-size audio frames"""
+    
+    def __init__(self, converter: AudioConverter, audio_source: rtc.AudioSource):
+        self._converter = converter
+        self._audio_source = audio_source
+        self._frame_bytes = converter.config.frame_samples * 2  # 16-bit samples
+        self._pending = bytearray()
+        self._frame = converter.create_audio_frame()  # Reused for every frame on this source
+    
+    async def feed(self, chunk: bytes) -> None:
+        """Buffer a chunk and publish every complete frame it makes available"""
+        self._pending.extend(chunk)
+        
+        complete = len(self._pending) - len(self._pending) % self._frame_bytes
+        if complete:
+            # Publish straight from the buffer; the view must be released before resizing it
+            view = memoryview(self._pending)
+            try:
+                await self._converter.bytes_to_audio_frames(
+                    view[:complete], self._audio_source, self._frame
+                )
+            finally:
+                view.release()
+            del self._pending[:complete]
+    
+    async def flush(self) -> None:
+        """Publish any buffered remainder as a final zero-padded frame"""
+        # Drop a dangling odd byte so the remainder is whole 16-bit samples
+        remainder = len(self._pending) - len(self._pending) % 2
+        if remainder:
+            await self._converter.bytes_to_audio_frames(
+                bytes(self._pending[:remainder]), self._audio_source, self._frame
+            )
+        self._pending.clear()
@@ -7,10 +7,16 @@ from typing import Optional, AsyncIterator, Callable, Any, Dict
 from livekit import rtc
 
 from ..models import TranscriptionResult, AudioConfig
-from ..providers.base import STTProvider
+from ..providers.base import STTProvider, STTStream, STTStreamEnded
 
 logger = logging.getLogger(__name__)
 
+# Speech recognition runs on mono audio; AudioStream downmixes natively when asked for one channel
+STT_NUM_CHANNELS = 1
+
+# Pause before reconnecting a failed STT stream, so a persistent error doesn't spin
+STT_RESTART_DELAY_SECONDS = 1.0
+
 
 class AudioProcessor:
     """Processes incoming audio tracks for speech-to-text"""
@@ -23,6 +29,10 @@ class AudioProcessor:
         self.stt_provider = stt_provider
         self.config = config
         self._active_streams: Dict[str, Any] = {}
+        # Bytes of 16-bit PCM to coalesce before each STT push
+        self._stt_chunk_bytes = (
+            config.sample_rate * config.stt_chunk_ms // 1000 * STT_NUM_CHANNELS * 2
+        )
     
     async def process_audio_track(
         self, 
@@ -34,28 +44,32 @@ class AudioProcessor:
         track_id = f"{track.sid}_{language}"
         
         try:
-            # Create audio stream from track
+            # Create audio stream from track, downmixed to mono before it reaches Python
+            # (config.num_channels describes the published TTS tracks, not STT input)
             audio_stream = rtc.AudioStream(
                 track, 
                 sample_rate=self.config.sample_rate,
-                num_channels=self.config.num_channels
+                num_channels=STT_NUM_CHANNELS
             )
             
-            # Create STT stream
-            stt_stream = self.stt_provider.create_stream(language)
-            
             # Store references for cleanup
-            self._active_streams[track_id] = {
-                'audio_stream': audio_stream,
-                'stt_stream': stt_stream
-            }
+            self._active_streams[track_id] = {'audio_stream': audio_stream}
             
-            # Process audio frames and STT results concurrently
-            await asyncio.gather(
-                self._process_audio_frames(audio_stream, stt_stream),
-                self._process_stt_results(stt_stream, on_transcription),
-                return_exceptions=True
-            )
+            while True:
+                # Create STT stream (replaced whenever recognition fails mid-track)
+                stt_stream = self.stt_provider.create_stream(language)
+                self._active_streams[track_id]['stt_stream'] = stt_stream
+                
+                restart_delay = await self._run_pipeline(audio_stream, stt_stream, on_transcription)
+                if restart_delay is None:
+                    break
+                
+                # The STT stream ended but the track is still live - reconnect STT
+                if restart_delay:
+                    logger.info(f"Restarting STT stream for track {track.sid}")
+                    await asyncio.sleep(restart_delay)
+                else:
+                    logger.debug(f"Rolling over STT stream for track {track.sid}")
             
         except Exception as e:
             logger.error(f"Error processing audio track: {e}")
@@ -63,17 +77,76 @@ class AudioProcessor:
             # Cleanup
             await self._cleanup_track(track_id)
     
-    async def _process_audio_frames(self, audio_stream: rtc.AudioStream, stt_stream) -> None:
-        """Process audio frames and push to STT"""
+    async def _run_pipeline(
+        self,
+        audio_stream: rtc.AudioStream,
+        stt_stream: STTStream,
+        on_transcription: Callable[[TranscriptionResult], None]
+    ) -> Optional[float]:
+        """
+        Run the audio and STT loops for one STT stream.
+        
+        Returns:
+            Seconds to wait before continuing the track on a new STT stream (0 for a
+            planned rollover), or None when the track is finished
+        """
+        restart_delay: Optional[float] = None
+        try:
+            # Process audio frames and STT results concurrently; a failure on
+            # either side cancels the other so a dead pipeline stops immediately
+            async with asyncio.TaskGroup() as tg:
+                audio_task = tg.create_task(self._process_audio_frames(audio_stream, stt_stream))
+                tg.create_task(self._process_stt_results(stt_stream, on_transcription))
+        except* STTStreamEnded:
+            # The stream hit its service limit or was closed by the server - reconnect at once
+            restart_delay = 0.0
+        except* Exception as eg:
+            for e in eg.exceptions:
+                logger.error(f"Error processing audio track: {e}")
+            # The audio side was only cancelled as the STT side's sibling
+            if audio_task.cancelled():
+                restart_delay = STT_RESTART_DELAY_SECONDS
+        finally:
+            try:
+                await stt_stream.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing STT stream: {e}")
+        
+        return restart_delay
+    
+    async def _process_audio_frames(self, audio_stream: rtc.AudioStream, stt_stream: STTStream) -> None:
+        """Process audio frames and push to STT in coalesced chunks"""
+        buffer = bytearray()
+        chunk_bytes = self._stt_chunk_bytes
         try:
             async for audio_event in audio_stream:
-                stt_stream.push_frame(audio_event.frame)
+                buffer += audio_event.frame.data
+                if len(buffer) >= chunk_bytes:
+                    stt_stream.push_frame(self._build_chunk_frame(buffer))
+                    buffer.clear()
         except Exception as e:
             logger.error(f"Error processing audio frames: {e}")
+            raise
+        
+        # Track ended - flush the remainder and half-close STT, so the finals for
+        # trailing speech still arrive before the results loop finishes
+        if buffer:
+            stt_stream.push_frame(self._build_chunk_frame(buffer))
+        await stt_stream.end_input()
+    
+    def _build_chunk_frame(self, buffer: bytearray) -> rtc.AudioFrame:
+        """Build a single audio frame from coalesced 16-bit PCM bytes"""
+        # AudioFrame copies its input, so the reusable buffer is passed without an extra bytes() copy
+        return rtc.AudioFrame(
+            data=buffer,
+            sample_rate=self.config.sample_rate,
+            num_channels=STT_NUM_CHANNELS,
+            samples_per_channel=len(buffer) // (2 * STT_NUM_CHANNELS)
+        )
     
     async def _process_stt_results(
         self, 
-        stt_stream, 
+        stt_stream: STTStream, 
         on_transcription: Callable[[TranscriptionResult], None]
     ) -> None:
         """Process STT results and call transcription handler"""
@@ -81,8 +154,11 @@ class AudioProcessor:
             async for result in stt_stream:
                 if result.is_final:
                     on_transcription(result)
+        except STTStreamEnded:
+            raise  # Planned rollover, not an error
         except Exception as e:
             logger.error(f"Error processing STT results: {e}")
+            raise
     
     async def _cleanup_track(self, track_id: str) -> None:
         """Cleanup resources for a track"""
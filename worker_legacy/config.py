@@ -1,16 +1,26 @@
 """
 Configuration and metadata parsing utilities.
 """
-import json
+import functools
 import logging
 import os
-from typing import Dict, Any, List, Tuple, Optional
+import sys
+from typing import Dict, Any, Tuple, Optional
+
+import orjson
 
 from .models import WorkerConfig, AudioConfig
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_credentials_json(credentials_json: str) -> Dict[str, Any]:
+    """Parse the credentials JSON once per distinct value (configs are loaded per event)"""
+    credentials_info: Dict[str, Any] = orjson.loads(credentials_json)
+    return credentials_info
+
+
 def load_worker_config_from_env() -> WorkerConfig:
     """Load worker configuration from environment variables"""
     # Google Cloud credentials
@@ -20,7 +30,7 @@ def load_worker_config_from_env() -> WorkerConfig:
     
     if credentials_json:
         try:
-            credentials_info = json.loads(credentials_json)
+            credentials_info = _parse_credentials_json(credentials_json)
             gcp_project_id = credentials_info.get("project_id")
             logger.info("Using Google credentials from GOOGLE_APPLICATION_CREDENTIALS_JSON")
         except Exception as e:
@@ -50,63 +60,86 @@ def load_audio_config_from_env() -> AudioConfig:
     sample_rate = int(os.getenv("AUDIO_SAMPLE_RATE", "48000"))
     num_channels = int(os.getenv("AUDIO_CHANNELS", "1"))
     frame_samples = int(os.getenv("AUDIO_FRAME_SAMPLES", "480"))
+    stt_chunk_ms = int(os.getenv("AUDIO_STT_CHUNK_MS", "100"))
     
     return AudioConfig(
         sample_rate=sample_rate,
         num_channels=num_channels,
-        frame_samples=frame_samples
+        frame_samples=frame_samples,
+        stt_chunk_ms=stt_chunk_ms
     )
 
 
-def parse_room_metadata(metadata: str) -> Tuple[List[str], List[str], Optional[str]]:
+def parse_room_metadata(metadata: str) -> Tuple[Dict[str, Tuple[bool, bool]], Optional[str]]:
     """
-    Parse translation targets and source language from room metadata.
+    Parse output languages and source language from room metadata.
     
     Returns:
-        Tuple of (translation_targets, audio_targets, source_language)
+        Tuple of (outputs, source_language), where outputs maps each language
+        (in metadata order, deduplicated) to its (captions, audio) flags
     """
-    t_targets: List[str] = []
-    a_targets: List[str] = []
+    outputs_by_lang: Dict[str, Tuple[bool, bool]] = {}
     src_lang: Optional[str] = None
     
     try:
         if not metadata:
             logger.warning("No room metadata provided")
-            return t_targets, a_targets, src_lang
+            return outputs_by_lang, src_lang
         
-        metadata_obj = json.loads(metadata)
+        metadata_obj = orjson.loads(metadata)
         logger.info(f"Room metadata: {metadata_obj}")
         
         # Parse source language
         src = metadata_obj.get("sourceLanguage")
-        if isinstance(src, str) and src:
-            src_lang = src
+        if type(src) is str and src:
+            src_lang = sys.intern(src)
         
-        # Parse output configurations
+        # Parse output configurations in a single pass; decoded JSON only yields
+        # exact builtin types, so identity checks are enough
         outputs = metadata_obj.get("outputs")
-        if isinstance(outputs, list):
+        if type(outputs) is list:
             for output in outputs:
-                if not isinstance(output, dict):
+                if type(output) is not dict:
                     continue
                 
                 lang = output.get("lang")
-                if not isinstance(lang, str) or not lang:
+                if type(lang) is not str or not lang:
                     continue
+                # Language codes key the per-language queues, voices and caches;
+                # interned, lookups can match by identity before comparing text
+                lang = sys.intern(lang)
                 
-                # Check if captions are enabled
-                if output.get("captions") is True:
-                    t_targets.append(lang)
-                
-                # Check if audio is enabled
-                if output.get("audio") is True:
-                    a_targets.append(lang)
+                # Merge flags if the same language is listed more than once
+                captions, audio = outputs_by_lang.get(lang, (False, False))
+                outputs_by_lang[lang] = (
+                    captions or output.get("captions") is True,
+                    audio or output.get("audio") is True
+                )
         
-        logger.info(f"Parsed metadata - src_lang: {src_lang}, translation_targets: {t_targets}, audio_targets: {a_targets}")
+        logger.info(f"Parsed metadata - src_lang: {src_lang}, outputs: {outputs_by_lang}")
         
     except Exception as e:
         logger.error(f"Failed to parse room metadata: {e}")
     
-    return t_targets, a_targets, src_lang
+    return outputs_by_lang, src_lang
+
+
+def is_same_language(language_a: str, language_b: str) -> bool:
+    """
+    Check whether two language codes name the same language.
+    
+    A bare code matches any regional variant of it ("en" and "en-US"), but two
+    different regions or scripts ("en-US" and "en-GB", "zh-CN" and "zh-TW") are
+    kept apart since translating between them can still change the text.
+    """
+    a = language_a.lower()
+    b = language_b.lower()
+    if a == b:
+        return True
+    
+    base_a, _, region_a = a.partition("-")
+    base_b, _, region_b = b.partition("-")
+    return base_a == base_b and (not region_a or not region_b)
 
 
 def update_config_from_metadata(
@@ -114,20 +147,23 @@ def update_config_from_metadata(
     metadata: str
 ) -> WorkerConfig:
     """Update worker configuration with room metadata"""
-    t_targets, a_targets, src_lang = parse_room_metadata(metadata)
+    outputs, src_lang = parse_room_metadata(metadata)
     
     # Update configuration
     if src_lang:
         config.primary_language = src_lang
     
-    # Remove duplicates and filter out primary language
+    # Outputs are already deduplicated; filter out primary language. Aliases of it
+    # ("en" for "en-US") stay targets - clients subscribe to their messages and audio
+    # track - and the translate provider passes their text through without an RPC
+    primary_language = config.primary_language
     config.translation_targets = [
-        lang for lang in dict.fromkeys(t_targets) 
-        if lang and lang != config.primary_language
+        lang for lang, (captions, _) in outputs.items()
+        if captions and lang != primary_language
     ]
     config.audio_targets = [
-        lang for lang in dict.fromkeys(a_targets) 
-        if lang and lang != config.primary_language
+        lang for lang, (_, audio) in outputs.items()
+        if audio and lang != primary_language
     ]
     
     logger.info(
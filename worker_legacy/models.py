@@ -61,6 +61,7 @@ class AudioConfig:
     sample_rate: int = 48000
     num_channels: int = 1
     frame_samples: int = 480
+    stt_chunk_ms: int = 100  # Audio coalesced per STT push (Google recommends ~100 ms)
 
 
 @dataclass
@@ -1,6 +1,7 @@
 """
 Abstract base classes for provider implementations.
 """
+import asyncio
 from abc import ABC, abstractmethod
 from typing import AsyncIterator, Optional, Dict, Any, List
 from livekit import rtc
@@ -8,6 +9,10 @@ from livekit import rtc
 from ..models import TranscriptionResult, TranslationResult, TTSRequest
 
 
+class STTStreamEnded(Exception):
+    """Raised by an STT stream that ended on its own (e.g. a service duration limit); open a new one to continue"""
+
+
 class STTProvider(ABC):
     """Abstract base class for Speech-to-Text providers"""
     
@@ -40,6 +45,11 @@ class STTStream(ABC):
         """Get next transcription result"""
         pass
     
+    @abstractmethod
+    async def end_input(self) -> None:
+        """Stop accepting audio and wait for the results of audio already pushed, then close"""
+        pass
+    
     @abstractmethod
     async def aclose(self) -> None:
         """Close the STT stream and cleanup resources"""
@@ -83,6 +93,26 @@ class TranslateProvider(ABC):
         """Translate text from source to target language"""
         pass
     
+    async def translate_as_completed(
+        self,
+        text: str,
+        source_language: str,
+        target_languages: List[str]
+    ) -> AsyncIterator[TranslationResult]:
+        """Translate text into several target languages, yielding each result as soon as it is ready"""
+        tasks = [
+            asyncio.create_task(self.translate(text, source_language, target))
+            for target in target_languages
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # The consumer stopped early (cancelled or failed) - don't leave orphaned requests
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
     @abstractmethod
     def get_supported_languages(self) -> List[str]:
         """Get list of supported language codes"""
@@ -0,0 +1,50 @@
+"""
+Shared gRPC channels and clients for the Google providers.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.auth.credentials import Credentials
+
+# Ping active connections so a dropped connection is noticed and replaced between
+# utterances rather than on the next RPC (which would pay TCP + TLS + HTTP/2 setup)
+GRPC_KEEPALIVE_OPTIONS: List[Tuple[str, int]] = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+# Process-wide clients keyed by (client class, service account email); each event's
+# worker reuses them instead of opening (and never closing) fresh channels
+_SHARED_CLIENTS: Dict[Tuple[Any, Optional[str]], Any] = {}
+
+
+def create_keepalive_transport(client_class: Any, credentials: Optional[Credentials]) -> Any:
+    """
+    Create a grpc_asyncio transport for a Google async client with keepalive enabled.
+    
+    ``client_class`` is the generated async client (e.g. TranslationServiceAsyncClient);
+    the returned transport is passed to it as ``transport=`` and reused for every call.
+    When ``credentials`` is None, application default credentials are used.
+    """
+    transport_class = client_class.get_transport_class("grpc_asyncio")
+    channel = transport_class.create_channel(
+        f"{client_class.DEFAULT_ENDPOINT}:443",
+        credentials=credentials,
+        options=GRPC_KEEPALIVE_OPTIONS,
+    )
+    return transport_class(channel=channel)
+
+
+def get_shared_client(client_class: Any, credentials: Optional[Credentials]) -> Any:
+    """
+    Get the process-wide instance of a Google async client, creating it on first use.
+    
+    Clients are shared per service account, so workers started for later events
+    reuse the warm channel. Creation doesn't await, so no lock is needed.
+    """
+    key = (client_class, getattr(credentials, "service_account_email", None))
+    client = _SHARED_CLIENTS.get(key)
+    if client is None:
+        client = client_class(transport=create_keepalive_transport(client_class, credentials))
+        _SHARED_CLIENTS[key] = client
+    return client
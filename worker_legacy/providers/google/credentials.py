@@ -0,0 +1,31 @@
+"""
+Shared Google Cloud credentials for the Google providers.
+"""
+import logging
+from typing import Dict, Any, Optional
+
+from google.oauth2 import service_account
+
+logger = logging.getLogger(__name__)
+
+
+def get_service_account_credentials(config: Dict[str, Any]) -> Optional[service_account.Credentials]:
+    """
+    Get service account credentials for a provider configuration.
+    
+    The credentials are built from ``gcp_credentials_info`` on first use and stored
+    back in the config under ``gcp_credentials``, so the STT, TTS and Translate
+    providers initialized from the same config share one parsed key.
+    """
+    credentials = config.get("gcp_credentials")
+    if credentials is not None:
+        return credentials
+    
+    credentials_info = config.get("gcp_credentials_info")
+    if not credentials_info:
+        return None
+    
+    credentials = service_account.Credentials.from_service_account_info(credentials_info)
+    config["gcp_credentials"] = credentials
+    logger.debug("Built shared Google service account credentials")
+    return credentials
@@ -3,21 +3,29 @@ Google Cloud Speech-to-Text provider implementation (Direct API).
 """
 import asyncio
 import logging
-import json
-import io
-from typing import AsyncIterator, Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from enum import Enum
 
 from livekit import rtc
+from google.api_core import exceptions as google_exceptions
 from google.cloud import speech
-from google.oauth2 import service_account
-import numpy as np
 
 from ...models import TranscriptionResult
-from ..base import STTProvider, STTStream
+from ..base import STTProvider, STTStream, STTStreamEnded
+from .channels import get_shared_client
+from .credentials import get_service_account_credentials
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on audio per streaming request (Google recommends ~100 ms, 25 KB max)
+MAX_REQUEST_BYTES = 25 * 1024
+
+# Audio allowed to wait for the STT stream; older audio is dropped beyond this
+MAX_QUEUED_AUDIO_SECONDS = 0.5
+
+# How long end_input() waits for the finals of trailing speech before cancelling
+FINAL_RESULTS_TIMEOUT_SECONDS = 5.0
+
 
 class SpeechEventType(Enum):
     """Speech event types (replaces agents framework enum)"""
@@ -33,33 +41,67 @@ class GoogleSTTStream(STTStream):
         self.client = client
         self.config = config
         self._closed = False
+        self._input_ended = False  # Half-closed: no more audio, results still arriving
         self._audio_queue = asyncio.Queue()
         self._stream_task: Optional[asyncio.Task] = None
         self._result_queue = asyncio.Queue()
+        # Why the stream stopped, if it wasn't closed by aclose(); raised to the consumer
+        self._error: Optional[Exception] = None
+        # The audio queue is bounded by bytes of 16-bit PCM, not by item count
+        self._queued_bytes = 0
+        self._max_queued_bytes = int(config.sample_rate_hertz * 2 * MAX_QUEUED_AUDIO_SECONDS)
         
     def push_frame(self, frame: rtc.AudioFrame) -> None:
         """Push an audio frame to the STT stream"""
-        if not self._closed:
+        if not self._closed and not self._input_ended:
             # Convert LiveKit audio frame to bytes for Google Speech
             # LiveKit frame data is already in the right format for streaming
             audio_data = self._convert_frame_to_bytes(frame)
-            try:
-                self._audio_queue.put_nowait(audio_data)
-            except asyncio.QueueFull:
-                logger.warning("Audio queue full, dropping frame")
+            
+            # Drop the oldest audio rather than let STT fall further behind live speech
+            while (self._queued_bytes + len(audio_data) > self._max_queued_bytes and
+                   not self._audio_queue.empty()):
+                dropped = self._audio_queue.get_nowait()
+                self._queued_bytes -= len(dropped)
+                logger.warning(f"STT audio backlog over {MAX_QUEUED_AUDIO_SECONDS}s, dropped {len(dropped)} bytes")
+            
+            self._audio_queue.put_nowait(audio_data)
+            self._queued_bytes += len(audio_data)
+    
+    def _take_audio(self, audio_data: Optional[bytes]) -> Optional[bytes]:
+        """Account for a chunk leaving the audio queue"""
+        if audio_data is not None:
+            self._queued_bytes -= len(audio_data)
+        return audio_data
     
     def _convert_frame_to_bytes(self, frame: rtc.AudioFrame) -> bytes:
         """Convert LiveKit AudioFrame to bytes suitable for Google Speech"""
-        # LiveKit audio frames contain float32 PCM data
-        # Google Speech expects LINEAR16 (16-bit PCM)
+        # LiveKit audio frames already carry 16-bit signed PCM, which is exactly
+        # Google's LINEAR16 - copy the raw bytes without any sample conversion
+        return bytes(frame.data)
+    
+    def _drain_audio_queue(self, audio_data: bytes) -> Tuple[bytes, Optional[bytes]]:
+        """
+        Append already-queued audio to a chunk without waiting.
         
-        # Convert frame data bytes back to numpy array
-        float_data = np.frombuffer(frame.data, dtype=np.float32)
+        Returns:
+            Tuple of (request_audio, carry), where carry is a queued chunk that
+            would have pushed the request past MAX_REQUEST_BYTES
+        """
+        if self._audio_queue.empty():
+            return audio_data, None
         
-        # Convert to 16-bit integers
-        int16_data = (float_data * 32767).astype(np.int16)
+        batch = bytearray(audio_data)
+        while not self._audio_queue.empty():
+            next_chunk = self._take_audio(self._audio_queue.get_nowait())
+            if next_chunk is None:  # Input ended - send what we have, then stop
+                self._audio_queue.put_nowait(None)
+                break
+            if len(batch) + len(next_chunk) > MAX_REQUEST_BYTES:
+                return bytes(batch), next_chunk
+            batch += next_chunk
         
-        return int16_data.tobytes()
+        return bytes(batch), None
     
     async def _start_streaming(self):
         """Start the Google Speech streaming recognition"""
@@ -77,30 +119,36 @@ class GoogleSTTStream(STTStream):
                 yield speech.StreamingRecognizeRequest(
                     streaming_config=speech.StreamingRecognitionConfig(
                         config=self.config,
-                        interim_results=True,
+                        # Only finals are consumed, so don't have Google stream
+                        # every growing hypothesis back to us
+                        interim_results=False,
                     )
                 )
                 
                 # Subsequent requests with audio data
+                carry: Optional[bytes] = None
                 while not self._closed:
                     try:
-                        # Wait for audio data with timeout
-                        audio_data = await asyncio.wait_for(
-                            self._audio_queue.get(), 
-                            timeout=1.0
-                        )
-                        yield speech.StreamingRecognizeRequest(audio_content=audio_data)
-                    except asyncio.TimeoutError:
-                        # Send keepalive or continue
-                        continue
+                        # Wait for audio data (unless a chunk was held back); None means closed
+                        if carry is not None:
+                            audio_data, carry = carry, None
+                        else:
+                            audio_data = self._take_audio(await self._audio_queue.get())
+                            if audio_data is None:
+                                break
+                        
+                        # Fold any backlog into the same request, up to the size cap
+                        audio_data, carry = self._drain_audio_queue(audio_data)
+                        if audio_data:
+                            yield speech.StreamingRecognizeRequest(audio_content=audio_data)
                     except Exception as e:
                         logger.error(f"Error getting audio data: {e}")
                         break
             
-            # Start streaming recognition
-            streaming_recognize = self.client.streaming_recognize(
-                requests=request_generator(),
-                timeout=60.0
+            # Start streaming recognition. No client deadline: the service ends the
+            # stream at its own duration limit, which is handled as a rollover below
+            streaming_recognize = await self.client.streaming_recognize(
+                requests=request_generator()
             )
             
             # Process responses
@@ -109,53 +157,77 @@ class GoogleSTTStream(STTStream):
                     continue
                     
                 result = response.results[0]
-                if result.alternatives:
+                # Only queue final results for now (can add interim later)
+                if result.is_final and result.alternatives:
                     alt = result.alternatives[0]
-                    
-                    transcript_result = TranscriptionResult(
+                    await self._result_queue.put(TranscriptionResult(
                         text=alt.transcript,
                         language=self.language,
-                        is_final=result.is_final,
-                        confidence=alt.confidence if result.is_final else 0.0
-                    )
-                    
-                    # Only queue final results for now (can add interim later)
-                    if result.is_final:
-                        await self._result_queue.put(transcript_result)
+                        is_final=True,
+                        confidence=alt.confidence
+                    ))
         
+        except (google_exceptions.OutOfRange, google_exceptions.DeadlineExceeded) as e:
+            # Stream duration limit - a planned rollover, not a failure
+            logger.debug(f"Google Speech stream reached its duration limit: {e}")
+            self._error = STTStreamEnded(str(e))
         except Exception as e:
             logger.error(f"Error in Google Speech streaming: {e}")
+            self._error = e
         finally:
+            # A stream that stops on its own is over for the consumer too - record it
+            # so __anext__ raises and the caller opens a new stream
+            if self._error is None and not self._closed and not self._input_ended:
+                self._error = STTStreamEnded("Google Speech stream ended")
+            # Stop accepting audio and wake any waiting consumer
+            self._closed = True
+            self._result_queue.put_nowait(None)
             logger.debug("Google Speech streaming ended")
     
     async def __anext__(self) -> TranscriptionResult:
         """Get next transcription result"""
-        if self._closed:
-            raise StopAsyncIteration
-        
         # Start streaming if not already started
-        if not self._stream_task:
+        if not self._stream_task and not self._closed:
             await self._start_streaming()
         
-        try:
-            # Wait for results with timeout
-            result = await asyncio.wait_for(
-                self._result_queue.get(),
-                timeout=30.0  # 30 second timeout
-            )
-            return result
-        except asyncio.TimeoutError:
-            # No results - continue waiting
-            if not self._closed:
-                return await self.__anext__()
-            else:
-                raise StopAsyncIteration
+        # None is queued when the stream ends or is closed; finals queued ahead of it
+        # are still delivered
+        result = await self._result_queue.get()
+        if result is None:
+            self._result_queue.put_nowait(None)  # Keep ending any later calls too
+            if self._error is not None:
+                raise self._error
+            raise StopAsyncIteration
+        return result
+    
+    async def end_input(self) -> None:
+        """Stop accepting audio and wait for the results of audio already pushed, then close"""
+        if self._closed or self._input_ended:
+            return
+        self._input_ended = True
+        
+        # Ending the request stream lets Google return the finals for trailing speech
+        self._audio_queue.put_nowait(None)
+        if self._stream_task:
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(self._stream_task),
+                    timeout=FINAL_RESULTS_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Timed out waiting for final STT results")
+        
+        await self.aclose()
     
     async def aclose(self) -> None:
         """Close the STT stream and cleanup resources"""
         if not self._closed:
             self._closed = True
             
+            # Wake the request generator and any result consumer
+            self._audio_queue.put_nowait(None)
+            self._result_queue.put_nowait(None)
+            
             # Cancel streaming task
             if self._stream_task and not self._stream_task.done():
                 self._stream_task.cancel()
@@ -178,15 +250,9 @@ class GoogleSTTProvider(STTProvider):
         """Initialize the Google Speech client"""
         self._credentials_info = config.get("gcp_credentials_info")
         
-        # Initialize Google Cloud Speech client
-        if self._credentials_info:
-            credentials = service_account.Credentials.from_service_account_info(
-                self._credentials_info
-            )
-            self._client = speech.SpeechAsyncClient(credentials=credentials)
-        else:
-            # Use default credentials (from environment)
-            self._client = speech.SpeechAsyncClient()
+        # Initialize Google Cloud Speech client (default credentials from environment if None)
+        credentials = get_service_account_credentials(config)
+        self._client = get_shared_client(speech.SpeechAsyncClient, credentials)
         
         logger.info("Google Cloud Speech-to-Text client initialized")
     
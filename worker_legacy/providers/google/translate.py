@@ -3,23 +3,40 @@ Google Cloud Translation provider implementation.
 """
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 
 from google.cloud import translate_v3 as translate
-from google.oauth2 import service_account
 
+from ...config import is_same_language
 from ...models import TranslationResult
 from ..base import TranslateProvider
+from .channels import get_shared_client
+from .credentials import get_service_account_credentials
 
 logger = logging.getLogger(__name__)
 
+# Translation cache limits
+CACHE_MAX_ENTRIES = 4096
+CACHE_TTL_SECONDS = 3600.0
+CACHE_MAX_TEXT_CHARS = 512  # Long utterances rarely repeat; don't let them fill the cache
+
+# Per-request deadline so one stuck target language can't hold its captions/TTS indefinitely
+TRANSLATE_TIMEOUT_SECONDS = 4.0
+
 
 class GoogleTranslateProvider(TranslateProvider):
     """Google Cloud Translation provider"""
     
     def __init__(self):
-        self._client: Optional[translate.TranslationServiceClient] = None
+        self._client: Optional[translate.TranslationServiceAsyncClient] = None
         self._project_id: Optional[str] = None
+        self._parent: Optional[str] = None  # projects/{id}/locations/global, built once
+        # LRU of (source, target, text) -> (cached_at, translated_text)
+        self._cache: "OrderedDict[Tuple[str, str, str], Tuple[float, str]]" = OrderedDict()
+        # Requests currently awaiting an RPC, shared by identical concurrent callers
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
     
     async def initialize(self, config: Dict[str, Any]) -> None:
         """Initialize the Google Translate provider"""
@@ -27,19 +44,22 @@ class GoogleTranslateProvider(TranslateProvider):
         self._project_id = config.get("gcp_project_id")
         
         try:
-            if credentials_info:
-                credentials = service_account.Credentials.from_service_account_info(credentials_info)
-                self._client = translate.TranslationServiceClient(credentials=credentials)
+            # One long-lived, process-wide client and channel serve every translate call
+            credentials = get_service_account_credentials(config)
+            self._client = get_shared_client(translate.TranslationServiceAsyncClient, credentials)
+            if credentials:
                 # Extract project_id from credentials if not provided
                 if not self._project_id:
                     self._project_id = credentials_info.get("project_id")
                 logger.info("Google Translate client initialized with provided credentials")
             else:
-                self._client = translate.TranslationServiceClient()
                 logger.info("Google Translate client initialized with default credentials")
         except Exception as e:
             logger.error(f"Failed to initialize Google Translate client: {e}")
             raise
+        
+        if self._project_id:
+            self._parent = f"projects/{self._project_id}/locations/global"
     
     async def translate(
         self, 
@@ -48,44 +68,99 @@ class GoogleTranslateProvider(TranslateProvider):
         target_language: str
     ) -> TranslationResult:
         """Translate text from source to target language"""
-        if not self._client or not self._project_id:
+        if not self._client or not self._parent:
             logger.warning("Google Translate not available, returning original text")
-            return TranslationResult(
-                text=text,
-                source_language=source_language,
-                target_language=target_language,
-                original_text=text
-            )
+            return self._make_result(text, text, source_language, target_language)
+        
+        # Nothing to translate: same language (or a bare/regional alias of it), or no
+        # letters (numbers, punctuation)
+        if (is_same_language(source_language, target_language) or
+                not any(c.isalpha() for c in text)):
+            return self._make_result(text, text, source_language, target_language)
         
-        parent = f"projects/{self._project_id}/locations/global"
+        cache_key = (source_language, target_language, text)
+        cached_text = self._get_cached(cache_key)
+        if cached_text is not None:
+            return self._make_result(cached_text, text, source_language, target_language)
         
-        def _translate() -> str:
-            request = translate.TranslateTextRequest(
-                parent=parent,
-                contents=[text],
-                mime_type="text/plain",
-                source_language_code=source_language,
-                target_language_code=target_language,
-            )
-            response = self._client.translate_text(request=request)
-            return response.translations[0].translated_text if response.translations else text
+        # Join an identical request that is already in flight instead of sending another
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            translated_text = await asyncio.shield(inflight)
+            return self._make_result(translated_text, text, source_language, target_language)
+        
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        
+        request = translate.TranslateTextRequest(
+            parent=self._parent,
+            contents=[text],
+            mime_type="text/plain",
+            source_language_code=source_language,
+            target_language_code=target_language,
+        )
         
         try:
-            translated_text = await asyncio.to_thread(_translate)
-            return TranslationResult(
-                text=translated_text,
-                source_language=source_language,
-                target_language=target_language,
-                original_text=text
-            )
-        except Exception as e:
-            logger.error(f"Translation error ({source_language} -> {target_language}): {e}")
-            return TranslationResult(
-                text=text,
-                source_language=source_language,
-                target_language=target_language,
-                original_text=text
-            )
+            try:
+                # Async gRPC call on the event loop - no worker thread per request
+                response = await self._client.translate_text(
+                    request=request,
+                    timeout=TRANSLATE_TIMEOUT_SECONDS
+                )
+                translated_text = (
+                    response.translations[0].translated_text if response.translations else text
+                )
+                self._store_cached(cache_key, translated_text)
+            except Exception as e:
+                logger.error(f"Translation error ({source_language} -> {target_language}): {e}")
+                translated_text = text
+            future.set_result(translated_text)
+        finally:
+            del self._inflight[cache_key]
+            if not future.done():
+                # Cancelled mid-request; waiters weren't, so give them the error fallback
+                future.set_result(text)
+        
+        return self._make_result(translated_text, text, source_language, target_language)
+    
+    @staticmethod
+    def _make_result(
+        translated_text: str,
+        original_text: str,
+        source_language: str,
+        target_language: str
+    ) -> TranslationResult:
+        """Build a translation result"""
+        return TranslationResult(
+            text=translated_text,
+            source_language=source_language,
+            target_language=target_language,
+            original_text=original_text
+        )
+    
+    def _get_cached(self, key: Tuple[str, str, str]) -> Optional[str]:
+        """Return a cached translation if present and not expired"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        cached_at, translated_text = entry
+        if time.monotonic() - cached_at > CACHE_TTL_SECONDS:
+            del self._cache[key]
+            return None
+        
+        self._cache.move_to_end(key)
+        return translated_text
+    
+    def _store_cached(self, key: Tuple[str, str, str], translated_text: str) -> None:
+        """Store a translation, evicting the least recently used entry when full"""
+        if len(key[2]) > CACHE_MAX_TEXT_CHARS:
+            return
+        
+        self._cache[key] = (time.monotonic(), translated_text)
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
     
     def get_supported_languages(self) -> List[str]:
         """Get list of supported language codes"""
@@ -3,16 +3,54 @@ Google Cloud Text-to-Speech provider implementation (Direct API).
 """
 import asyncio
 import logging
-from typing import AsyncIterator, Dict, Any, List, Optional
+import re
+from typing import AsyncIterator, Dict, Any, List, Optional, Set, Tuple
 
+from google.api_core import exceptions as google_exceptions
 from google.cloud import texttospeech
-from google.oauth2 import service_account
 
 from ...models import TTSRequest
 from ..base import TTSProvider
+from .channels import get_shared_client
+from .credentials import get_service_account_credentials
 
 logger = logging.getLogger(__name__)
 
+# Voice families served by StreamingSynthesize; others use SynthesizeSpeech
+STREAMING_VOICE_MARKERS = ("Chirp3-HD", "Chirp-HD")
+
+# Errors meaning a voice can't be streamed at all (vs. transient failures worth retrying)
+STREAMING_UNSUPPORTED_ERRORS = (google_exceptions.InvalidArgument, google_exceptions.MethodNotImplemented)
+
+# Batch synthesis splits text longer than this into sentences
+SENTENCE_SPLIT_MIN_CHARS = 120
+
+# Synthesis RPCs allowed in flight at once across all target languages
+MAX_CONCURRENT_SYNTHESIS = 3
+
+# Latin punctuation needs following whitespace; CJK full-width punctuation doesn't
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|(?<=[\u3002\uff01\uff1f])\s*")
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split long text at sentence boundaries; short text is returned whole"""
+    if len(text) <= SENTENCE_SPLIT_MIN_CHARS:
+        return [text]
+    
+    sentences = [sentence for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+    return sentences or [text]
+
+
+def _strip_wav_header(audio: bytes) -> bytes:
+    """Return the PCM samples of a LINEAR16 response without its WAV header"""
+    if audio[:4] != b"RIFF":
+        return audio
+    
+    data_index = audio.find(b"data", 12)
+    if data_index == -1:
+        return audio
+    return audio[data_index + 8:]
+
 
 class GoogleTTSProvider(TTSProvider):
     """Google Cloud Text-to-Speech provider (Direct API)"""
@@ -21,20 +59,28 @@ class GoogleTTSProvider(TTSProvider):
         self._client: Optional[texttospeech.TextToSpeechAsyncClient] = None
         self._credentials_info: Optional[Dict[str, Any]] = None
         self._voice_cache: Dict[str, List[str]] = {}  # Cache for available voices
+        self._batch_only_voices: Set[str] = set()  # Voices that rejected streaming synthesis
+        # Request protos are immutable in use, so build them once and reuse them
+        self._voice_params: Dict[Tuple[str, str], texttospeech.VoiceSelectionParams] = {}
+        # Held only while a request is being answered, never while audio waits for playback
+        self._synthesis_slots = asyncio.Semaphore(MAX_CONCURRENT_SYNTHESIS)
+        self._audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.LINEAR16,
+            sample_rate_hertz=48000  # Match LiveKit sample rate
+        )
+        self._streaming_audio_config = texttospeech.StreamingAudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.PCM,
+            sample_rate_hertz=48000  # Match LiveKit sample rate
+        )
     
     async def initialize(self, config: Dict[str, Any]) -> None:
         """Initialize the Google TTS provider"""
         self._credentials_info = config.get("gcp_credentials_info")
         
-        # Initialize Google Cloud TTS client
-        if self._credentials_info:
-            credentials = service_account.Credentials.from_service_account_info(
-                self._credentials_info
-            )
-            self._client = texttospeech.TextToSpeechAsyncClient(credentials=credentials)
-        else:
-            # Use default credentials
-            self._client = texttospeech.TextToSpeechAsyncClient()
+        # Initialize Google Cloud TTS client (one client serves every target language;
+        # default credentials from environment if None)
+        credentials = get_service_account_credentials(config)
+        self._client = get_shared_client(texttospeech.TextToSpeechAsyncClient, credentials)
         
         logger.info("Google Cloud Text-to-Speech client initialized")
     
@@ -68,6 +114,24 @@ class GoogleTTSProvider(TTSProvider):
         
         return language_map.get(language, language)
     
+    def _get_voice_params(self, language_code: str, voice_name: str) -> texttospeech.VoiceSelectionParams:
+        """Get cached voice selection params for a language and voice"""
+        key = (language_code, voice_name)
+        voice = self._voice_params.get(key)
+        if voice is None:
+            voice = texttospeech.VoiceSelectionParams(
+                language_code=language_code,
+                name=voice_name
+            )
+            self._voice_params[key] = voice
+        return voice
+    
+    def _supports_streaming(self, voice_name: str) -> bool:
+        """Check whether a voice can be used with StreamingSynthesize"""
+        if voice_name in self._batch_only_voices:
+            return False
+        return any(marker in voice_name for marker in STREAMING_VOICE_MARKERS)
+    
     async def synthesize(self, request: TTSRequest) -> AsyncIterator[bytes]:
         """Synthesize speech from text"""
         if not self._client:
@@ -79,39 +143,112 @@ class GoogleTTSProvider(TTSProvider):
             voice_name = self._get_voice_for_language(request.language, request.voice_name)
             language_code = self._normalize_language_code(request.language)
             
-            # Create synthesis input
-            synthesis_input = texttospeech.SynthesisInput(text=request.text)
-            
             # Configure voice
-            voice = texttospeech.VoiceSelectionParams(
-                language_code=language_code,
-                name=voice_name
-            )
+            voice = self._get_voice_params(language_code, voice_name)
             
-            # Configure audio
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.LINEAR16,
-                sample_rate_hertz=48000  # Match LiveKit sample rate
-            )
+            # Prefer streaming so playback can start on the first audio chunk
+            if self._supports_streaming(voice_name):
+                streamed = False
+                try:
+                    async for chunk in self._synthesize_streaming(request.text, voice):
+                        streamed = True
+                        yield chunk
+                    return
+                except Exception as e:
+                    if streamed:
+                        raise
+                    if isinstance(e, STREAMING_UNSUPPORTED_ERRORS):
+                        # Voice/region without streaming support - remember and fall back
+                        logger.warning(f"Streaming TTS unavailable for {voice_name}, using batch synthesis: {e}")
+                        self._batch_only_voices.add(voice_name)
+                    else:
+                        # Transient failure - fall back for this request only
+                        logger.warning(f"Streaming TTS failed for {voice_name}, retrying with batch synthesis: {e}")
             
-            # Perform synthesis
-            response = await self._client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config,
-                timeout=30.0
-            )
-            
-            # Yield the entire audio content
-            # Note: Google TTS returns complete audio, not streaming chunks
-            if response.audio_content:
-                yield response.audio_content
+            async for chunk in self._synthesize_batch(request.text, voice):
+                yield chunk
             
         except Exception as e:
             logger.error(f"TTS synthesis error for {request.language}: {e}")
-            # Don't yield anything on error
+            # Don't yield anything more on error
             return
     
+    async def _synthesize_streaming(
+        self,
+        text: str,
+        voice: texttospeech.VoiceSelectionParams
+    ) -> AsyncIterator[bytes]:
+        """Synthesize with StreamingSynthesize, yielding raw PCM chunks as they arrive"""
+        client = self._client
+        if client is None:
+            raise RuntimeError("TTS client not initialized")
+        
+        async def request_generator() -> AsyncIterator[texttospeech.StreamingSynthesizeRequest]:
+            # First request with config, then the text
+            yield texttospeech.StreamingSynthesizeRequest(
+                streaming_config=texttospeech.StreamingSynthesizeConfig(
+                    voice=voice,
+                    streaming_audio_config=self._streaming_audio_config
+                )
+            )
+            yield texttospeech.StreamingSynthesizeRequest(
+                input=texttospeech.StreamingSynthesisInput(text=text)
+            )
+        
+        # The stream is read by its own task into an unbounded queue, so the RPC
+        # deadline and the synthesis slot cover synthesis only, never playback pace
+        chunks: asyncio.Queue = asyncio.Queue()
+        
+        async def read_stream() -> None:
+            try:
+                async with self._synthesis_slots:
+                    responses = await client.streaming_synthesize(
+                        requests=request_generator(),
+                        timeout=30.0
+                    )
+                    async for response in responses:
+                        if response.audio_content:
+                            chunks.put_nowait(response.audio_content)
+            finally:
+                chunks.put_nowait(None)
+        
+        reader = asyncio.create_task(read_stream())
+        try:
+            while (chunk := await chunks.get()) is not None:
+                yield chunk
+            await reader  # Raise any stream error (e.g. truncated synthesis)
+        finally:
+            if not reader.done():
+                reader.cancel()
+    
+    async def _synthesize_batch(
+        self,
+        text: str,
+        voice: texttospeech.VoiceSelectionParams
+    ) -> AsyncIterator[bytes]:
+        """Synthesize with SynthesizeSpeech, one call per sentence for long text"""
+        client = self._client
+        if client is None:
+            raise RuntimeError("TTS client not initialized")
+        
+        # SynthesizeSpeech returns complete audio, so long text is split at sentence
+        # boundaries and the first sentence plays while the next is synthesized
+        for sentence in _split_sentences(text):
+            # Create synthesis input
+            synthesis_input = texttospeech.SynthesisInput(text=sentence)
+            
+            # Perform synthesis
+            async with self._synthesis_slots:
+                response = await client.synthesize_speech(
+                    input=synthesis_input,
+                    voice=voice,
+                    audio_config=self._audio_config,
+                    timeout=30.0
+                )
+            
+            if response.audio_content:
+                yield _strip_wav_header(response.audio_content)
+    
     def get_available_voices(self, language: str) -> List[str]:
         """Get available voices for a language"""
         # This is a simplified implementation with common voices
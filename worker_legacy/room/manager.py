@@ -3,7 +3,7 @@ Room event management utilities.
 """
 import asyncio
 import logging
-from typing import Dict, List, Callable, Optional, Any
+from typing import Dict, List, Callable, Optional, Any, Set, Tuple
 from livekit import rtc
 
 from ..models import TranscriptionResult, TTSRequest, AudioConfig
@@ -12,6 +12,15 @@ from ..audio.converter import AudioConverter
 
 logger = logging.getLogger(__name__)
 
+# Pending TTS requests per language; older requests are dropped to keep audio live
+TTS_QUEUE_MAXSIZE = 4
+
+# Synthesized audio chunks buffered ahead of playback per language
+TTS_PLAYBACK_BUFFER = 2
+
+# Marks the end of one utterance's audio in the playback queue
+_UTTERANCE_END = object()
+
 
 class RoomManager:
     """Manages LiveKit room events and interactions"""
@@ -24,9 +33,11 @@ class RoomManager:
         self.room = room
         self.audio_config = audio_config
         self._event_handlers: Dict[str, List[Callable]] = {}
+        self._handler_tasks: Set[asyncio.Task] = set()  # Keeps async handler tasks referenced
         self._audio_tracks: Dict[str, Dict[str, Any]] = {}
         self._tts_queues: Dict[str, asyncio.Queue] = {}
         self._tts_tasks: List[asyncio.Task] = []
+        self._tts_dropped: Dict[str, int] = {}
         self.audio_converter = AudioConverter(audio_config)
     
     def setup_event_handlers(self) -> None:
@@ -67,6 +78,16 @@ class RoomManager:
             logger.info("Room disconnected")
             self._notify_handlers("room_disconnected")
     
+    def get_subscribed_audio_tracks(self) -> List[Tuple[rtc.Track, rtc.RemoteParticipant]]:
+        """Get audio tracks that were already subscribed before event handlers were set up"""
+        tracks: List[Tuple[rtc.Track, rtc.RemoteParticipant]] = []
+        for participant in self.room.remote_participants.values():
+            for publication in participant.track_publications.values():
+                track = publication.track
+                if track is not None and track.kind == rtc.TrackKind.KIND_AUDIO:
+                    tracks.append((track, participant))
+        return tracks
+    
     def add_event_handler(self, event_name: str, handler: Callable) -> None:
         """Add an event handler for a specific event"""
         if event_name not in self._event_handlers:
@@ -79,7 +100,9 @@ class RoomManager:
             for handler in self._event_handlers[event_name]:
                 try:
                     if asyncio.iscoroutinefunction(handler):
-                        asyncio.create_task(handler(*args))
+                        task = asyncio.create_task(handler(*args))
+                        self._handler_tasks.add(task)
+                        task.add_done_callback(self._handler_tasks.discard)
                     else:
                         handler(*args)
                 except Exception as e:
@@ -108,7 +131,7 @@ class RoomManager:
             await self.room.local_participant.publish_track(track, options)
             
             # Set up TTS queue and task
-            tts_queue = asyncio.Queue()
+            tts_queue: asyncio.Queue = asyncio.Queue(maxsize=TTS_QUEUE_MAXSIZE)
             tts_task = asyncio.create_task(
                 self._process_tts_queue(language, tts_provider, audio_source, tts_queue)
             )
@@ -131,10 +154,20 @@ class RoomManager:
     
     async def queue_tts_request(self, language: str, request: TTSRequest) -> None:
         """Queue a TTS request for processing"""
-        if language in self._tts_queues:
-            await self._tts_queues[language].put(request)
-        else:
+        queue = self._tts_queues.get(language)
+        if queue is None:
             logger.warning(f"No TTS queue available for language: {language}")
+            return
+        
+        try:
+            queue.put_nowait(request)
+        except asyncio.QueueFull:
+            # TTS is behind the live captions - drop the oldest pending text
+            queue.get_nowait()
+            queue.put_nowait(request)
+            dropped = self._tts_dropped.get(language, 0) + 1
+            self._tts_dropped[language] = dropped
+            logger.warning(f"TTS queue full for {language}, dropped stale request ({dropped} total)")
     
     async def _process_tts_queue(
         self, 
@@ -144,23 +177,71 @@ class RoomManager:
         queue: asyncio.Queue
     ) -> None:
         """Process TTS requests for a specific language"""
+        # Synthesis runs ahead of real-time playback so the next utterance is
+        # synthesized while the current one is still being captured
+        playback_queue: asyncio.Queue = asyncio.Queue(maxsize=TTS_PLAYBACK_BUFFER)
+        
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    self._synthesize_tts_requests(language, tts_provider, queue, playback_queue)
+                )
+                tg.create_task(
+                    self._play_tts_audio(language, audio_source, playback_queue)
+                )
+        except* Exception as eg:
+            for e in eg.exceptions:
+                logger.error(f"TTS pipeline error for {language}: {e}")
+    
+    async def _synthesize_tts_requests(
+        self,
+        language: str,
+        tts_provider: TTSProvider,
+        queue: asyncio.Queue,
+        playback_queue: asyncio.Queue
+    ) -> None:
+        """Synthesize queued TTS requests into the playback queue"""
+        # Bind hot methods once rather than per request
+        get_request = queue.get
+        synthesize = tts_provider.synthesize
+        put_audio = playback_queue.put
+        
         while True:
+            request = await get_request()
+            if request is None:  # Shutdown signal
+                await put_audio(None)
+                break
+            
             try:
-                request = await queue.get()
-                if request is None:  # Shutdown signal
-                    break
-                
-                # Synthesize audio
-                audio_data = b""
-                async for chunk in tts_provider.synthesize(request):
-                    audio_data += chunk
-                
-                # Convert and publish audio frames
-                if audio_data:
-                    await self.audio_converter.bytes_to_audio_frames(audio_data, audio_source)
-                
+                async for chunk in synthesize(request):
+                    await put_audio(chunk)
             except Exception as e:
                 logger.error(f"TTS processing error for {language}: {e}")
+            
+            await put_audio(_UTTERANCE_END)
+    
+    async def _play_tts_audio(
+        self,
+        language: str,
+        audio_source: rtc.AudioSource,
+        playback_queue: asyncio.Queue
+    ) -> None:
+        """Publish synthesized audio to the language's audio source at real-time pace"""
+        get_audio = playback_queue.get
+        frame_stream = self.audio_converter.create_frame_stream(audio_source)
+        
+        while True:
+            item = await get_audio()
+            if item is None:  # Shutdown signal
+                break
+            
+            try:
+                if item is _UTTERANCE_END:
+                    await frame_stream.flush()
+                else:
+                    await frame_stream.feed(item)
+            except Exception as e:
+                logger.error(f"TTS playback error for {language}: {e}")
     
     def get_audio_track(self, language: str) -> Optional[rtc.LocalAudioTrack]:
         """Get the audio track for a specific language"""
@@ -178,7 +259,9 @@ class RoomManager:
         try:
             # Stop TTS tasks
             for queue in self._tts_queues.values():
-                await queue.put(None)  # Shutdown signal
+                if queue.full():
+                    queue.get_nowait()  # Make room rather than block on a bounded queue
+                queue.put_nowait(None)  # Shutdown signal
             
             # Wait for TTS tasks to complete
             if self._tts_tasks:
@@ -188,6 +271,7 @@ class RoomManager:
             self._audio_tracks.clear()
             self._tts_queues.clear()
             self._tts_tasks.clear()
+            self._tts_dropped.clear()
             
             logger.info("Room manager cleanup complete")
             
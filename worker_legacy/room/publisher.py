@@ -1,68 +1,160 @@
 """
 Data publishing utilities for LiveKit rooms.
 """
-import json
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
 from livekit import rtc
 
 from ..models import MessageData, TranscriptionResult, TranslationResult
 
 logger = logging.getLogger(__name__)
 
+# Reliable data packets carry up to 15 KiB of user data; batches are split to stay under it
+MAX_PACKET_BYTES = 15 * 1024
+
+# Envelope for several messages sent in one packet
+_BATCH_OPEN = b'{"type":"batch","messages":['
+_BATCH_CLOSE = b']}'
+
 
 class DataPublisher:
     """Publishes data messages to LiveKit room data channel"""
     
     def __init__(self, room: rtc.Room):
         self.room = room
+        # Serialized constant fields keyed by (type, lang, src_lang, is_final); only "text" varies
+        self._prefixes: Dict[Tuple[str, str, Optional[str], bool], bytes] = {}
+        # Messages published during the current loop tick, and the task that sends them
+        self._pending: List[bytes] = []
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def publish_message(self, message: MessageData) -> None:
         """Publish a message to the room data channel"""
         try:
-            data = json.dumps(message.to_dict()).encode('utf-8')
-            await self.room.local_participant.publish_data(data)
+            await self._publish_bytes(orjson.dumps(message.to_dict()))
         except Exception as e:
             logger.error(f"Error publishing message: {e}")
     
+    async def _publish_bytes(self, *messages: bytes) -> None:
+        """Publish already-serialized messages, coalesced with others sent in the same loop tick"""
+        self._pending.extend(messages)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        # Shielded so one cancelled caller doesn't drop the send for the whole batch
+        await asyncio.shield(self._flush_task)
+    
+    async def _flush_pending(self) -> None:
+        """Send the messages queued this tick, batching as many as fit in each data packet"""
+        try:
+            # Yield once so publishers scheduled in the same tick can join the packet
+            await asyncio.sleep(0)
+        finally:
+            # Reset even if cancelled, so later publishes start a fresh flush
+            messages, self._pending = self._pending, []
+            self._flush_task = None
+        
+        for data in self._pack_messages(messages):
+            try:
+                await self.room.local_participant.publish_data(data)
+            except Exception as e:
+                logger.error(f"Error publishing message: {e}")
+    
+    @staticmethod
+    def _pack_messages(messages: List[bytes]) -> List[bytes]:
+        """Group messages into packets of at most MAX_PACKET_BYTES (a batch message if several)"""
+        packets: List[bytes] = []
+        group: List[bytes] = []
+        group_bytes = len(_BATCH_OPEN) + len(_BATCH_CLOSE)
+        
+        for message in messages:
+            # Each message after the first also costs a separating comma
+            added = len(message) + (1 if group else 0)
+            if group and group_bytes + added > MAX_PACKET_BYTES:
+                packets.append(DataPublisher._encode_packet(group))
+                group = []
+                group_bytes = len(_BATCH_OPEN) + len(_BATCH_CLOSE)
+                added = len(message)
+            group.append(message)
+            group_bytes += added
+        
+        if group:
+            packets.append(DataPublisher._encode_packet(group))
+        return packets
+    
+    @staticmethod
+    def _encode_packet(messages: List[bytes]) -> bytes:
+        """Encode one packet: a lone message as-is, several as a batch message"""
+        if len(messages) == 1:
+            return messages[0]
+        return _BATCH_OPEN + b','.join(messages) + _BATCH_CLOSE
+    
+    def _message_prefix(
+        self,
+        msg_type: str,
+        lang: str,
+        is_final: bool,
+        src_lang: Optional[str] = None
+    ) -> bytes:
+        """Get the cached JSON prefix for a message, open for its "text" value"""
+        key = (msg_type, lang, src_lang, is_final)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            fields = MessageData(
+                type=msg_type,
+                lang=lang,
+                src_lang=src_lang,
+                is_final=is_final
+            ).to_dict()
+            # Reopen the object so only the text value is serialized per message
+            prefix = orjson.dumps(fields)[:-1] + b',"text":'
+            self._prefixes[key] = prefix
+        return prefix
+    
+    def _encode_message(
+        self,
+        msg_type: str,
+        lang: str,
+        text: str,
+        is_final: bool,
+        src_lang: Optional[str] = None
+    ) -> bytes:
+        """Encode a message from a cached JSON prefix (same output as MessageData.to_dict)"""
+        return self._message_prefix(msg_type, lang, is_final, src_lang) + orjson.dumps(text) + b'}'
+    
     async def publish_transcription(self, result: TranscriptionResult) -> None:
         """Publish a transcription result"""
-        # Publish caption message
-        caption_msg = MessageData(
-            type="caption",
-            lang=result.language,
-            text=result.text,
-            is_final=result.is_final
-        )
-        await self.publish_message(caption_msg)
-        
-        # Publish original language text message
-        original_msg = MessageData(
-            type="original-language-text",
-            lang=result.language,
-            text=result.text,
-            is_final=result.is_final
-        )
-        await self.publish_message(original_msg)
+        # Both messages carry the same text, so it is escaped once and shared
+        text = orjson.dumps(result.text) + b'}'
+        caption = self._message_prefix("caption", result.language, result.is_final) + text
+        original = self._message_prefix(
+            "original-language-text", result.language, result.is_final
+        ) + text
+        # Caption and original language text are queued together, so they share a packet
+        # unless it is too full
+        await self._publish_bytes(caption, original)
     
     async def publish_translation(self, result: TranslationResult) -> None:
         """Publish a translation result"""
-        translation_msg = MessageData(
-            type=f"translation-text-{result.target_language}",
-            src_lang=result.source_language,
-            lang=result.target_language,
-            text=result.text,
-            is_final=True
+        await self._publish_bytes(
+            self._encode_message(
+                f"translation-text-{result.target_language}",
+                result.target_language,
+                result.text,
+                True,
+                src_lang=result.source_language
+            )
         )
-        await self.publish_message(translation_msg)
     
     async def publish_custom_data(self, data: Dict[str, Any]) -> None:
         """Publish custom data to the room"""
         try:
-            json_data = json.dumps(data).encode('utf-8')
-            await self.room.local_participant.publish_data(json_data)
+            json_data = orjson.dumps(data)
         except Exception as e:
             logger.error(f"Error publishing custom data: {e}")
+            return
+        await self._publish_bytes(json_data)
     
     async def publish_status_message(self, status: str, details: str = "") -> None:
         """Publish a status message"""
@@ -3,7 +3,7 @@ Modular translation worker implementation.
 """
 import asyncio
 import logging
-from typing import Optional, List
+from typing import Optional, List, Set, Coroutine, Any
 
 from livekit import rtc
 
@@ -45,6 +45,9 @@ class ModularTranslationWorker:
         self.data_publisher: Optional[DataPublisher] = None
         self.audio_processor: Optional[AudioProcessor] = None
         
+        # Background tasks are referenced here so they aren't garbage collected mid-flight
+        self._tasks: Set[asyncio.Task] = set()
+        
         # State tracking
         self._initialized = False
         self._running = False
@@ -74,6 +77,9 @@ class ModularTranslationWorker:
         # Set up audio tracks for target languages
         await self._setup_audio_tracks()
         
+        # Open provider connections in the background so the first utterance doesn't pay for it
+        self._spawn(self._warm_up_providers())
+        
         self._initialized = True
         logger.info("Modular translation worker initialized successfully")
     
@@ -102,6 +108,37 @@ class ModularTranslationWorker:
             f"Translate={self.worker_config.translate_provider}"
         )
     
+    async def _warm_up_providers(self) -> None:
+        """Send throwaway translate and TTS requests to open channels and fetch auth tokens"""
+        warmups = []
+        
+        translation_targets = self.worker_config.translation_targets
+        if self.translate_provider and translation_targets:
+            warmups.append(self.translate_provider.translate(
+                "hi",
+                self.worker_config.primary_language,
+                translation_targets[0]
+            ))
+        
+        audio_targets = self.worker_config.audio_targets
+        if self.tts_provider and audio_targets:
+            warmups.append(self._drain_tts(TTSRequest(text="hi", language=audio_targets[0])))
+        
+        results = await asyncio.gather(*warmups, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Provider warm-up failed: {result}")
+        
+        logger.info("Provider warm-up complete")
+    
+    async def _drain_tts(self, request: TTSRequest) -> None:
+        """Synthesize a request and discard the audio"""
+        if not self.tts_provider:
+            return
+        
+        async for _ in self.tts_provider.synthesize(request):
+            pass
+    
     def _initialize_components(self) -> None:
         """Initialize core worker components"""
         # Room management
@@ -130,6 +167,13 @@ class ModularTranslationWorker:
             "audio_track_removed",
             self._handle_audio_track_removed
         )
+        
+        # The room connects (and auto-subscribes) before handlers exist, so pick up
+        # tracks whose track_subscribed event already fired. Nothing awaits between
+        # registering the handlers and this scan, so no track is seen twice.
+        for track, participant in self.room_manager.get_subscribed_audio_tracks():
+            logger.info(f"Found existing audio track from {participant.identity}")
+            self._start_audio_track(track)
     
     async def _setup_audio_tracks(self) -> None:
         """Set up audio tracks for target languages"""
@@ -145,12 +189,16 @@ class ModularTranslationWorker:
     
     async def _handle_audio_track_added(self, track: rtc.Track, participant: rtc.RemoteParticipant) -> None:
         """Handle new audio track subscription"""
+        self._start_audio_track(track)
+    
+    def _start_audio_track(self, track: rtc.Track) -> None:
+        """Start STT processing for an audio track"""
         if not self.audio_processor:
             logger.error("Audio processor not initialized")
             return
         
         # Start processing the audio track
-        asyncio.create_task(
+        self._spawn(
             self.audio_processor.process_audio_track(
                 track,
                 self.worker_config.primary_language,
@@ -168,13 +216,32 @@ class ModularTranslationWorker:
         if not result.is_final:
             return
         
+        # Skip empty or punctuation-only finals (common at silence boundaries)
+        text = result.text.strip()
+        if not any(c.isalnum() for c in text):
+            return
+        result.text = text
+        
         logger.info(f"Transcribed: {result.text}")
         
-        # Publish transcription
-        asyncio.create_task(self._publish_transcription(result))
+        # Dispatch translations first so the translate request isn't queued behind captions
+        self._spawn(self._process_translations(result))
         
-        # Process translations
-        asyncio.create_task(self._process_translations(result))
+        # Publish transcription
+        self._spawn(self._publish_transcription(result))
+    
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        """Start a background task, keeping a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+    
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """Drop a finished background task and log any unhandled error"""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task failed: {task.exception()}")
     
     async def _publish_transcription(self, result: TranscriptionResult) -> None:
         """Publish transcription result"""
@@ -192,31 +259,32 @@ class ModularTranslationWorker:
         if not self.translate_provider or not self.room_manager:
             return
         
-        # Create translation tasks
-        translation_tasks = []
-        for target_lang in self.worker_config.translation_targets:
-            translation_tasks.append(
-                self._handle_translation(result, target_lang)
-            )
+        target_languages = self.worker_config.translation_targets
+        if not target_languages:
+            return
         
-        if translation_tasks:
-            await asyncio.gather(*translation_tasks, return_exceptions=True)
-    
-    async def _handle_translation(self, result: TranscriptionResult, target_language: str) -> None:
-        """Handle translation for a single target language"""
+        # Publish and queue TTS for each language as soon as its translation arrives,
+        # so the fastest language isn't held back by the slowest
+        handlers = []
         try:
-            # Translate text
-            translation_result = await self.translate_provider.translate(
+            async for translation in self.translate_provider.translate_as_completed(
                 result.text,
                 result.language,
-                target_language
-            )
-            
-            # Publish translation
-            if self.data_publisher:
-                await self.data_publisher.publish_translation(translation_result)
-            
-            # Queue TTS if audio output is enabled for this language
+                target_languages
+            ):
+                handlers.append(asyncio.create_task(self._handle_translation(translation)))
+        except Exception as e:
+            logger.error(f"Translation error: {e}")
+        
+        if handlers:
+            await asyncio.gather(*handlers, return_exceptions=True)
+    
+    async def _handle_translation(self, translation_result: TranslationResult) -> None:
+        """Publish a translation and queue TTS for its target language"""
+        target_language = translation_result.target_language
+        try:
+            # Queue TTS first if audio output is enabled for this language - the
+            # per-language TTS worker starts synthesizing while the text is published
             if (target_language in self.worker_config.audio_targets and 
                 self.room_manager):
                 tts_request = TTSRequest(
@@ -224,6 +292,10 @@ class ModularTranslationWorker:
                     language=target_language
                 )
                 await self.room_manager.queue_tts_request(target_language, tts_request)
+            
+            # Publish translation
+            if self.data_publisher:
+                await self.data_publisher.publish_translation(translation_result)
         
         except Exception as e:
             logger.error(f"Translation handling error for {target_language}: {e}")
@@ -254,6 +326,10 @@ class ModularTranslationWorker:
         logger.info("Starting translation worker cleanup")
         
         try:
+            # Cancel in-flight background work
+            for task in list(self._tasks):
+                task.cancel()
+            
             # Cleanup components
             if self.room_manager:
                 await self.room_manager.cleanup()